@@ -9,7 +9,8 @@ Default-device switching goes through IPolicyConfig, the same undocumented COM
 interface the Settings sound page uses. pycaw already ships the interface
 definition, so there is no new dependency and no hand-rolled vtable here.
 
-COM is initialized per call via _with_com, like the rest of the server.
+COM work runs on the server's COM thread via _with_com, like the rest of the
+server.
 """
 
 from __future__ import annotations
@@ -17,7 +18,7 @@ from __future__ import annotations
 import logging
 from ctypes import POINTER, cast
 
-from .server import _with_com, mcp
+from .server import _default_id, _with_com, mcp
 
 logger = logging.getLogger("sentinel-mcp-windows.audio")
 
@@ -43,22 +44,6 @@ def _endpoint_volume(device):
     return cast(iface, POINTER(IAudioEndpointVolume))
 
 
-def _default_id(flow: int) -> str:
-    """Device id of the current default endpoint for a data flow, or ""."""
-    import comtypes
-    from pycaw.api.mmdeviceapi import IMMDeviceEnumerator
-    from pycaw.constants import CLSID_MMDeviceEnumerator
-
-    try:
-        enumerator = comtypes.CoCreateInstance(
-            CLSID_MMDeviceEnumerator, IMMDeviceEnumerator, comtypes.CLSCTX_INPROC_SERVER
-        )
-        # eMultimedia is the role users mean by "my speakers".
-        return enumerator.GetDefaultAudioEndpoint(flow, 1).GetId()
-    except Exception:  # noqa: BLE001 — no default device is a valid state
-        return ""
-
-
 def _active_devices(flow: int) -> list:
     from pycaw.pycaw import AudioUtilities
 
@@ -87,6 +87,9 @@ _HANDSFREE = 0x111E  # HFP (mic/calls)
 _SERVICE_DISABLE = 0x00
 _SERVICE_ENABLE = 0x01
 
+# Seconds between connection-state checks after a connect/disconnect request.
+_POLL_INTERVAL = 0.25
+
 
 def _api() -> ctypes.WinDLL:
     bt = ctypes.windll.BluetoothAPIs
@@ -160,6 +163,21 @@ def _set_audio_services(device: _DEVICE_INFO, enable: bool) -> list[str]:
     return errors
 
 
+def _wait_for_connection(name: str, connected: bool, timeout: float) -> _DEVICE_INFO | None:
+    """Poll until the named device's connected flag matches; None after timeout.
+
+    Short polls return as soon as Windows reports the change, where fixed
+    one-second sleeps over-waited by up to a second on every connect.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(_POLL_INTERVAL)
+        fresh, _err = _find_device(name)
+        if fresh is not None and bool(fresh.fConnected) == connected:
+            return fresh
+    return None
+
+
 @mcp.tool()
 def bluetooth_devices() -> str:
     """List paired Bluetooth devices and whether each is currently connected."""
@@ -199,12 +217,10 @@ def bluetooth_connect(name: str) -> str:
                     f"for headphones and speakers, not phones."
                 )
             return f"Could not connect to {device.szName}: " + "; ".join(errors)
-        # Poll for the connection to come up (device may be off/out of range).
-        for _ in range(10):
-            time.sleep(1)
-            fresh, _err = _find_device(device.szName)
-            if fresh is not None and fresh.fConnected:
-                return f"Connected to {fresh.szName}."
+        # Wait for the connection to come up (device may be off/out of range).
+        fresh = _wait_for_connection(device.szName, connected=True, timeout=10)
+        if fresh is not None:
+            return f"Connected to {fresh.szName}."
         return (
             f"Sent connect request to {device.szName}, but it did not connect "
             f"within 10s - make sure the device is powered on and in range."
@@ -224,15 +240,12 @@ def bluetooth_disconnect(name: str) -> str:
         if not device.fConnected:
             return f"{device.szName} is not connected - no change needed."
         _set_audio_services(device, enable=False)
-        for _ in range(5):
-            time.sleep(1)
-            fresh, _err = _find_device(device.szName)
-            if fresh is not None and not fresh.fConnected:
-                # Re-enable the services so auto-connect and the next
-                # bluetooth_connect keep working; this does not reconnect
-                # a device the user just disconnected in most cases, but
-                # connect() force-toggles anyway.
-                return f"Disconnected {device.szName}."
+        if _wait_for_connection(device.szName, connected=False, timeout=5) is not None:
+            # Re-enable the services so auto-connect and the next
+            # bluetooth_connect keep working; this does not reconnect
+            # a device the user just disconnected in most cases, but
+            # connect() force-toggles anyway.
+            return f"Disconnected {device.szName}."
         return f"Sent disconnect to {device.szName}, but it still shows connected."
     except Exception as e:
         logger.exception("bluetooth_disconnect failed")
@@ -288,7 +288,7 @@ def disp_screenshot_window(title_substring: str) -> str:
         image = ImageGrab.grab(bbox=box, all_screens=True)
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = Path(tempfile.gettempdir()) / f"sentinel_window_{stamp}.png"
-        image.save(path)
+        image.save(path, compress_level=1)  # speed over size, as in take_screenshot
         return f"Saved a screenshot of '{title}' to {path}"
     except Exception as e:
         logger.exception("disp_screenshot_window failed")
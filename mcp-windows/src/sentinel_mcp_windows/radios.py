@@ -5,13 +5,20 @@ disable, no pnputil, no device-manager operations. Only the software radio
 switch is used — the exact same mechanism as the Windows quick-settings tiles.
 
 WinRT projection only works from Windows PowerShell 5.1 (not pwsh 7), so the
-scripts below are always run with the full path to powershell.exe.
+scripts below are always run with the full path to powershell.exe. One
+powershell.exe is kept running and fed scripts over stdin (_PowerShellHost):
+starting it and loading the CLR + WinRT projection costs most of a second, which
+used to be paid on every radio call.
 """
 
 from __future__ import annotations
 
+import base64
 import logging
+import queue
 import subprocess
+import threading
+import time
 
 from .server import mcp
 
@@ -19,9 +26,24 @@ logger = logging.getLogger("sentinel-mcp-windows.radios")
 
 WINDOWS_POWERSHELL = r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
 
-# Standard Await/AsTask pattern for consuming WinRT IAsyncOperation from PS 5.1.
-_WINRT_PRELUDE = """\
+_TIMEOUT_S = 45
+
+# Per call: radio state and access can change between calls.
+_RADIO_ACCESS = """\
+  $access = Await ([Windows.Devices.Radios.Radio]::RequestAccessAsync()) `
+    ([Windows.Devices.Radios.RadioAccessStatus])
+  if ($access -ne 'Allowed') { Write-Output "ACCESS_DENIED|$access"; return }
+  $radios = Await ([Windows.Devices.Radios.Radio]::GetRadiosAsync()) `
+    ([System.Collections.Generic.IReadOnlyList[Windows.Devices.Radios.Radio]])
+"""
+
+# Loaded once per host process, so PowerShell parses it once: the Await/AsTask
+# pattern for consuming WinRT IAsyncOperation from PS 5.1, the Radio type
+# projection, and the two functions the tools call.
+_HOST_INIT = (
+    """\
 $ErrorActionPreference = 'Stop'
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
 Add-Type -AssemblyName System.Runtime.WindowsRuntime
 $asTaskGeneric = ([System.WindowsRuntimeSystemExtensions].GetMethods() |
   Where-Object { $_.Name -eq 'AsTask' -and $_.GetParameters().Count -eq 1 -and
@@ -33,39 +55,34 @@ Function Await($WinRtTask, $ResultType) {
   $netTask.Result
 }
 [Windows.Devices.Radios.Radio,Windows.System.Devices,ContentType=WindowsRuntime] | Out-Null
-$access = Await ([Windows.Devices.Radios.Radio]::RequestAccessAsync()) `
-  ([Windows.Devices.Radios.RadioAccessStatus])
-if ($access -ne 'Allowed') { Write-Output "ACCESS_DENIED|$access"; exit 0 }
-$radios = Await ([Windows.Devices.Radios.Radio]::GetRadiosAsync()) `
-  ([System.Collections.Generic.IReadOnlyList[Windows.Devices.Radios.Radio]])
+Function Get-SentinelRadios {
 """
-
-_GET_SCRIPT = (
-    _WINRT_PRELUDE
+    + _RADIO_ACCESS
     + """\
-if ($radios.Count -eq 0) { Write-Output 'NO_RADIOS'; exit 0 }
-foreach ($r in $radios) { Write-Output ("RADIO|{0}|{1}|{2}" -f $r.Kind, $r.State, $r.Name) }
+  if ($radios.Count -eq 0) { Write-Output 'NO_RADIOS'; return }
+  foreach ($r in $radios) { Write-Output ("RADIO|{0}|{1}|{2}" -f $r.Kind, $r.State, $r.Name) }
+}
+Function Set-SentinelRadio($kind, $state) {
+"""
+    + _RADIO_ACCESS
+    + """\
+  $target = @($radios | Where-Object { $_.Kind -eq $kind })
+  if ($target.Count -eq 0) { Write-Output 'NOT_FOUND'; return }
+  foreach ($r in $target) {
+    if ("$($r.State)" -eq $state) {
+      Write-Output ("ALREADY|{0}|{1}" -f $r.State, $r.Name)
+      continue
+    }
+    $res = Await ($r.SetStateAsync($state)) ([Windows.Devices.Radios.RadioAccessStatus])
+    Write-Output ("RESULT|{0}|{1}|{2}" -f $res, $r.State, $r.Name)
+  }
+}
 """
 )
 
-# Set script body. {kind} and {state} are ONLY ever filled from the fixed
-# literal mappings below — never from user input. This is .format()-ed on its
-# own and then prepended with the prelude at call time: the prelude's literal
-# PowerShell braces are single, so formatting it would raise KeyError.
-_SET_SCRIPT_BODY = """\
-$target = @($radios | Where-Object {{ $_.Kind -eq '{kind}' }})
-if ($target.Count -eq 0) {{ Write-Output 'NOT_FOUND'; exit 0 }}
-foreach ($r in $target) {{
-  if ("$($r.State)" -eq '{state}') {{
-    Write-Output ("ALREADY|{{0}}|{{1}}" -f $r.State, $r.Name)
-    continue
-  }}
-  $res = Await ($r.SetStateAsync('{state}')) ([Windows.Devices.Radios.RadioAccessStatus])
-  Write-Output ("RESULT|{{0}}|{{1}}|{{2}}" -f $res, $r.State, $r.Name)
-}}
-"""
+_GET_SCRIPT = "Get-SentinelRadios"
 
-# Fixed literal mappings — the only values ever interpolated into the script.
+# Fixed literal mappings — the only values ever passed to Set-SentinelRadio.
 _RADIO_KINDS = {"wifi": "WiFi", "bluetooth": "Bluetooth"}
 _RADIO_STATES = {True: "On", False: "Off"}
 
@@ -75,28 +92,120 @@ _ACCESS_DENIED_MSG = (
 )
 
 
+class _PowerShellHost:
+    """A long-lived Windows PowerShell 5.1 process that runs scripts sent over stdin.
+
+    stdin commands are line based, so each script travels base64-encoded on one
+    line and its output is read up to an end marker. Not thread-safe; callers
+    hold _host_lock.
+    """
+
+    _END = "<<sentinel-end>>"
+
+    def __init__(self, init_script: str):
+        self._proc = subprocess.Popen(
+            [WINDOWS_POWERSHELL, "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        threading.Thread(target=self._pump, name="powershell-host", daemon=True).start()
+        # Dot-sourced so its functions and variables stay defined for later scripts.
+        try:
+            lines = self.run(init_script, _TIMEOUT_S, dot_source=True)
+        except Exception:
+            self.close()
+            raise
+        for line in lines:
+            if line.startswith("ERROR|"):
+                self.close()
+                raise RuntimeError(f"PowerShell setup failed: {line.split('|', 1)[1][:200]}")
+
+    def _pump(self) -> None:
+        assert self._proc.stdout is not None
+        for line in self._proc.stdout:
+            self._lines.put(line.rstrip("\r\n"))
+        self._lines.put(None)
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(self, script: str, timeout: float, dot_source: bool = False) -> list[str]:
+        """Run script, return its non-empty output lines.
+
+        A terminating PowerShell error comes back as an "ERROR|message" line.
+        Raises TimeoutError/RuntimeError if the host itself stops responding.
+        """
+        assert self._proc.stdin is not None
+        encoded = base64.b64encode(script.encode("utf-8")).decode("ascii")
+        block = (
+            "([scriptblock]::Create([Text.Encoding]::UTF8.GetString("
+            f"[Convert]::FromBase64String('{encoded}'))))"
+        )
+        self._proc.stdin.write(
+            f"try {{ {'.' if dot_source else '&'} {block} }} "
+            "catch { Write-Output ('ERROR|' + $_.Exception.Message) }; "
+            f"Write-Output '{self._END}'\n"
+        )
+        self._proc.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        out: list[str] = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError(f"PowerShell did not answer within {timeout:g}s") from None
+            if line is None:
+                raise RuntimeError("PowerShell exited unexpectedly")
+            if line == self._END:
+                return out
+            if line.strip():
+                out.append(line.strip())
+
+    def close(self) -> None:
+        try:
+            self._proc.kill()
+        except OSError:
+            pass
+
+
+_host: _PowerShellHost | None = None
+_host_lock = threading.Lock()
+
+
 def _run_radio_script(script: str) -> list[str]:
-    """Run a WinRT radio script in Windows PowerShell 5.1, return output lines.
+    """Run a command against the shared PowerShell 5.1 host, return output lines.
 
-    Raises RuntimeError with a short message on failure.
+    Raises RuntimeError with a short message on failure. A host that hangs or
+    dies is discarded; the next call starts a fresh one.
     """
-    result = subprocess.run(
-        [WINDOWS_POWERSHELL, "-NoProfile", "-Command", script],
-        capture_output=True,
-        text=True,
-        timeout=45,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"PowerShell failed: {result.stderr.strip()[:200]}")
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    global _host
+    with _host_lock:
+        try:
+            if _host is None or not _host.alive():
+                _host = _PowerShellHost(_HOST_INIT)
+            lines = _host.run(script, _TIMEOUT_S)
+        except Exception:
+            if _host is not None:
+                _host.close()
+                _host = None
+            raise
+    for line in lines:
+        if line.startswith("ERROR|"):
+            raise RuntimeError(f"PowerShell failed: {line.split('|', 1)[1][:200]}")
+    return lines
 
 
 def _set_radio(kind_key: str, enabled: bool) -> str:
     """Turn a radio kind on/off via the software radio switch and report the result."""
     kind = _RADIO_KINDS[kind_key]  # fixed literal, never user input
     state = _RADIO_STATES[enabled]
-    script = _WINRT_PRELUDE + _SET_SCRIPT_BODY.format(kind=kind, state=state)
-    lines = _run_radio_script(script)
+    lines = _run_radio_script(f"Set-SentinelRadio '{kind}' '{state}'")
 
     for line in lines:
         if line.startswith("ACCESS_DENIED|"):
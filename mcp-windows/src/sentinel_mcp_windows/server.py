@@ -8,8 +8,9 @@ Notes:
 - FastMCP handles the MCP protocol; tools here must be plain sync defs.
 - Never print to stdout: it corrupts the stdio MCP protocol. All logging goes
   to stderr via the logging module.
-- COM is initialized per call (CoInitialize/CoUninitialize) because the MCP
-  runtime may invoke tools from different threads.
+- COM work runs on one long-lived worker thread (see _with_com) because the MCP
+  runtime may invoke tools from different threads; keeping a single apartment
+  alive lets interface pointers be cached between calls.
 """
 
 from __future__ import annotations
@@ -22,9 +23,13 @@ import re
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 from urllib.parse import urlparse
 
 import psutil
@@ -48,6 +53,12 @@ VK_MEDIA_PLAY_PAUSE = 0xB3
 KEYEVENTF_KEYUP = 0x0002
 SW_RESTORE = 9
 
+WINDOW_SHOW_COMMANDS: dict[str, int] = {
+    "minimize": 6,  # SW_MINIMIZE
+    "maximize": 3,  # SW_MAXIMIZE
+    "restore": SW_RESTORE,
+}
+
 MEDIA_KEYS: dict[str, int] = {
     "play_pause": VK_MEDIA_PLAY_PAUSE,
     "next": VK_MEDIA_NEXT_TRACK,
@@ -56,61 +67,174 @@ MEDIA_KEYS: dict[str, int] = {
 }
 
 # Processes that must never be terminated.
-PROTECTED_PROCESSES = {
-    "explorer.exe",
-    "csrss.exe",
-    "winlogon.exe",
-    "services.exe",
-    "lsass.exe",
-    "svchost.exe",
-    "system",
-}
+PROTECTED_PROCESSES = frozenset(
+    {
+        "explorer.exe",
+        "csrss.exe",
+        "winlogon.exe",
+        "services.exe",
+        "lsass.exe",
+        "svchost.exe",
+        "system",
+    }
+)
+
+# How long a Get-StartApps listing is reused (see _get_start_apps).
+START_APPS_TTL = 300.0
 
 # Allowed characters in app names passed to launch_app.
 APP_NAME_RE = re.compile(r"^[\w .+&()-]+$")
 
+_start_apps_cache: tuple[float, list[dict[str, str]]] | None = None
+
+# COM state. Everything below is only touched on the COM worker thread.
+_com_pool: ThreadPoolExecutor | None = None
+_com_pool_lock = threading.Lock()
+_com_thread = threading.local()
+_enumerator: Any = None
+# (device id, IAudioEndpointVolume) of the default speakers, rebuilt when the
+# default device changes or a call on it fails (e.g. the headset was unplugged).
+_speakers: tuple[str, Any] | None = None
+
+T = TypeVar("T")
+
 
 # --- Helpers ---
 
 
-def _get_endpoint_volume():
+def _default_id(flow: int) -> str:
+    """Device id of the current default endpoint for a data flow, or "".
+
+    flow is an EDataFlow value: 0 for output, 1 for input. Must run on the COM
+    thread.
+    """
+    global _enumerator
+    import comtypes
+    from pycaw.api.mmdeviceapi import IMMDeviceEnumerator
+    from pycaw.constants import CLSID_MMDeviceEnumerator
+
+    try:
+        if _enumerator is None:
+            _enumerator = comtypes.CoCreateInstance(
+                CLSID_MMDeviceEnumerator, IMMDeviceEnumerator, comtypes.CLSCTX_INPROC_SERVER
+            )
+        # eMultimedia is the role users mean by "my speakers".
+        return _enumerator.GetDefaultAudioEndpoint(flow, 1).GetId()
+    except Exception:  # noqa: BLE001 — no default device is a valid state
+        # Also covers a broken enumerator (e.g. audiosrv restarted): rebuild it
+        # next time rather than reporting "no device" until the server restarts.
+        _enumerator = None
+        return ""
+
+
+def _get_endpoint_volume() -> Any:
     """Return the IAudioEndpointVolume interface for the default speakers.
 
-    Caller is responsible for COM initialization.
+    Must run on the COM thread (inside _with_com). The interface is cached and
+    reused while the default output device stays the same, which skips the
+    device lookup, property reads and Activate() on every volume call.
 
     Supports both modern pycaw (GetSpeakers returns an AudioDevice with an
     EndpointVolume property) and the older raw-IMMDevice API.
     """
+    global _speakers
+    device_id = _default_id(0)
+    cached = _speakers
+    if cached is not None and device_id and cached[0] == device_id:
+        return cached[1]
+
     from pycaw.pycaw import AudioUtilities
 
     device = AudioUtilities.GetSpeakers()
     endpoint = getattr(device, "EndpointVolume", None)
-    if endpoint is not None:
-        return endpoint
+    if endpoint is None:
+        # Legacy pycaw: GetSpeakers returns a raw IMMDevice.
+        from ctypes import POINTER, cast
+
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import IAudioEndpointVolume
+
+        interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        endpoint = cast(interface, POINTER(IAudioEndpointVolume))
+    _speakers = (device_id, endpoint) if device_id else None
+    return endpoint
+
 
-    # Legacy pycaw: GetSpeakers returns a raw IMMDevice.
-    from ctypes import POINTER, cast
+def _with_speakers(fn: Callable[[Any], T]) -> T:
+    """Run fn(endpoint_volume) on the COM thread.
 
-    from comtypes import CLSCTX_ALL
-    from pycaw.pycaw import IAudioEndpointVolume
+    A failure drops the cached endpoint, so a device that went away is looked
+    up afresh on the next call instead of failing every time.
+    """
+
+    def call() -> T:
+        global _speakers
+        try:
+            return fn(_get_endpoint_volume())
+        except Exception:
+            _speakers = None
+            raise
+
+    return _with_com(call)
 
-    interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-    return cast(interface, POINTER(IAudioEndpointVolume))
 
+def _apply_volume(vol: Any, level: int | None = None, delta: int = 0) -> tuple[int | None, int]:
+    """Set the master volume to ``level``, or move it by ``delta``; return (old, new).
 
-def _with_com(fn):
-    """Run fn with COM initialized on the current thread (per-call init)."""
+    Shared by set_volume and adjust_volume; runs inside _with_speakers. An
+    absolute level skips the read (old is None) and, above 0, unmutes like the
+    Windows slider does. A relative change already at the limit writes nothing.
+    """
+    current = None
+    if level is None:
+        current = round(vol.GetMasterVolumeLevelScalar() * 100)
+        level = max(0, min(100, current + delta))
+        if level == current:
+            return current, level
+    vol.SetMasterVolumeLevelScalar(level / 100.0, None)
+    if current is None and level > 0:
+        vol.SetMute(0, None)
+    return current, level
+
+
+def _init_com_thread() -> None:
     import comtypes
 
     comtypes.CoInitialize()
-    try:
+    _com_thread.active = True
+
+
+def _with_com(fn: Callable[[], T]) -> T:
+    """Run fn on the COM worker thread and return its result.
+
+    One thread with COM initialized for its whole life, instead of
+    CoInitialize/CoUninitialize around every call: interfaces created there
+    stay valid, so they can be cached. Calls are serialized, which COM tools
+    here never needed to avoid. Nested calls run inline.
+    """
+    global _com_pool
+    if getattr(_com_thread, "active", False):
         return fn()
-    finally:
-        comtypes.CoUninitialize()
+    if _com_pool is None:
+        with _com_pool_lock:
+            if _com_pool is None:
+                _com_pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="com", initializer=_init_com_thread
+                )
+    return _com_pool.submit(fn).result()
 
 
-def _get_start_apps() -> list[dict[str, str]]:
-    """Return installed/startable apps as [{"Name": ..., "AppID": ...}, ...]."""
+def _get_start_apps(fresh: bool = False) -> list[dict[str, str]]:
+    """Return installed/startable apps as [{"Name": ..., "AppID": ...}, ...].
+
+    Get-StartApps is a PowerShell launch (around a second), and the app list
+    rarely changes, so the result is reused for START_APPS_TTL seconds unless
+    ``fresh`` is set.
+    """
+    global _start_apps_cache
+    cached = _start_apps_cache
+    if not fresh and cached is not None and time.monotonic() - cached[0] < START_APPS_TTL:
+        return cached[1]
     result = subprocess.run(
         ["powershell", "-NoProfile", "-Command", "Get-StartApps | ConvertTo-Json"],
         capture_output=True,
@@ -122,11 +246,13 @@ def _get_start_apps() -> list[dict[str, str]]:
     data = json.loads(result.stdout)
     if isinstance(data, dict):
         data = [data]
-    return [
+    apps = [
         {"Name": str(a.get("Name", "")), "AppID": str(a.get("AppID", ""))}
         for a in data
         if a.get("Name") and a.get("AppID")
     ]
+    _start_apps_cache = (time.monotonic(), apps)
+    return apps
 
 
 def _resolve_start_app(
@@ -139,11 +265,18 @@ def _resolve_start_app(
     name = name.strip()
     if not name or not APP_NAME_RE.match(name):
         return None, "Error: app name contains invalid characters."
-    if apps is None:
-        apps = _get_start_apps()
     lname = name.lower()
-    exact = [a for a in apps if a["Name"].lower() == lname]
-    matches = exact or [a for a in apps if lname in a["Name"].lower()]
+
+    def find(apps: list[dict[str, str]]) -> list[dict[str, str]]:
+        exact = [a for a in apps if a["Name"].lower() == lname]
+        return exact or [a for a in apps if lname in a["Name"].lower()]
+
+    if apps is not None:
+        matches = find(apps)
+    else:
+        matches = find(_get_start_apps())
+        if not matches:  # maybe installed since the list was cached
+            matches = find(_get_start_apps(fresh=True))
     if not matches:
         return None, f"No app found matching '{name}'. Try list_apps to see options."
     if len(matches) > 1:
@@ -153,7 +286,12 @@ def _resolve_start_app(
 
 
 def _launch_app_id(app_id: str) -> None:
-    """Launch an app by its shell AppID via Explorer (same as the Start menu)."""
+    """Launch an app by its shell AppID via Explorer (same as the Start menu).
+
+    Explorer hands the request to the running shell, so the app starts outside
+    this server's process tree; the MCP client kills that tree (a job object)
+    when the session closes.
+    """
     subprocess.Popen(["explorer.exe", f"shell:AppsFolder\\{app_id}"])
 
 
@@ -186,13 +324,12 @@ def get_volume() -> str:
     """Get the current system master volume level and mute state."""
     try:
 
-        def read():
-            vol = _get_endpoint_volume()
+        def read(vol):
             level = round(vol.GetMasterVolumeLevelScalar() * 100)
             muted = bool(vol.GetMute())
             return level, muted
 
-        level, muted = _with_com(read)
+        level, muted = _with_speakers(read)
         return f"Volume: {level}%{' (muted)' if muted else ''}"
     except Exception as e:
         logger.exception("get_volume failed")
@@ -206,13 +343,7 @@ def set_volume(level: int) -> str:
         if not 0 <= level <= 100:
             return "Error: level must be between 0 and 100."
 
-        def write():
-            vol = _get_endpoint_volume()
-            vol.SetMasterVolumeLevelScalar(level / 100.0, None)
-            if level > 0:
-                vol.SetMute(0, None)
-
-        _with_com(write)
+        _with_speakers(lambda vol: _apply_volume(vol, level=level))
         return f"Volume set to {level}%."
     except Exception as e:
         logger.exception("set_volume failed")
@@ -224,14 +355,13 @@ def set_mute(muted: bool) -> str:
     """Mute (true) or unmute (false) the system master audio."""
     try:
 
-        def _apply() -> bool:
-            vol = _get_endpoint_volume()
+        def _apply(vol) -> bool:
             if bool(vol.GetMute()) == muted:
                 return False
             vol.SetMute(1 if muted else 0, None)
             return True
 
-        changed = _with_com(_apply)
+        changed = _with_speakers(_apply)
         if not changed:
             return f"Audio is already {'muted' if muted else 'unmuted'} - no change needed."
         return "Audio muted." if muted else "Audio unmuted."
@@ -247,14 +377,7 @@ def adjust_volume(delta: int) -> str:
         if not -100 <= delta <= 100:
             return "Error: delta must be between -100 and 100."
 
-        def _apply():
-            vol = _get_endpoint_volume()
-            current = round(vol.GetMasterVolumeLevelScalar() * 100)
-            new = max(0, min(100, current + delta))
-            vol.SetMasterVolumeLevelScalar(new / 100, None)
-            return current, new
-
-        current, new = _with_com(_apply)
+        current, new = _with_speakers(lambda vol: _apply_volume(vol, delta=delta))
         if current == new:
             return f"Volume unchanged at {current}% (already at the limit)."
         return f"Volume changed from {current}% to {new}%."
@@ -325,7 +448,8 @@ def media_control(action: Literal["play_pause", "next", "previous", "stop"]) ->
 def list_apps(query: str = "") -> str:
     """List installed/startable apps, optionally filtered by a case-insensitive query."""
     try:
-        apps = _get_start_apps()
+        # The explicit "what's installed" call, so always list fresh.
+        apps = _get_start_apps(fresh=True)
         q = query.lower().strip()
         if q:
             apps = [a for a in apps if q in a["Name"].lower()]
@@ -440,15 +564,13 @@ def focus_window(title_substring: str) -> str:
 def window_control(title_substring: str, action: Literal["minimize", "maximize", "restore"]) -> str:
     """Minimize, maximize, or restore the first visible window whose title contains
     the given substring (case-insensitive)."""
-    SW_MINIMIZE, SW_MAXIMIZE = 6, 3
-    show = {"minimize": SW_MINIMIZE, "maximize": SW_MAXIMIZE, "restore": SW_RESTORE}
     try:
         sub = title_substring.strip().lower()
         if not sub:
             return "Error: empty title substring."
         for hwnd, title in _enum_visible_windows():
             if sub in title.lower():
-                ctypes.windll.user32.ShowWindow(hwnd, show[action])
+                ctypes.windll.user32.ShowWindow(hwnd, WINDOW_SHOW_COMMANDS[action])
                 return f"{action.capitalize()}d window: {title}"
         return f"No visible window found containing '{title_substring}'."
     except Exception as e:
@@ -493,7 +615,9 @@ def take_screenshot() -> str:
         img = ImageGrab.grab(all_screens=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = f"{tempfile.gettempdir()}\\sentinel_screenshot_{timestamp}.png"
-        img.save(path, "PNG")
+        # Fastest zlib level: screen captures are mostly flat colour, so the
+        # file barely grows while encoding a 4K frame takes a fraction as long.
+        img.save(path, "PNG", compress_level=1)
         return f"Screenshot saved to {path}"
     except Exception as e:
         logger.exception("take_screenshot failed")
@@ -148,15 +148,21 @@ def workspace_save(name: str, app_names: list[str], urls: list[str] = []) -> str
         if bad_urls:
             return f"Error: only http/https URLs are allowed: {', '.join(bad_urls)}"
 
-        installed = _get_start_apps()
-        resolved: list[dict[str, str]] = []
-        unresolved: list[str] = []
-        for app_name in app_names:
-            app, error = _resolve_start_app(app_name, installed)
-            if app is None:
-                unresolved.append(f"{app_name} ({error})")
-            else:
-                resolved.append({"name": app["Name"], "app_id": app["AppID"]})
+        def resolve(installed: list[dict[str, str]]) -> tuple[list[dict[str, str]], list[str]]:
+            resolved: list[dict[str, str]] = []
+            unresolved: list[str] = []
+            for app_name in app_names:
+                app, error = _resolve_start_app(app_name, installed)
+                if app is None:
+                    unresolved.append(f"{app_name} ({error})")
+                else:
+                    resolved.append({"name": app["Name"], "app_id": app["AppID"]})
+            return resolved, unresolved
+
+        resolved, unresolved = resolve(_get_start_apps())
+        if unresolved:
+            # The cached listing may predate a just-installed app.
+            resolved, unresolved = resolve(_get_start_apps(fresh=True))
 
         if not resolved and not urls:
             return "Error: no apps could be resolved. " + "; ".join(unresolved)
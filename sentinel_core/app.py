@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
@@ -51,8 +52,6 @@ def load_settings(store: Store) -> Settings:
 
 async def _run_routine(app: FastAPI, routine: dict) -> None:
     """Run a routine's prompt through the agents and announce the result."""
-    import asyncio
-
     from .notify import toast
 
     session_id = app.state.store.start_session()
@@ -75,14 +74,63 @@ async def _run_routine(app: FastAPI, routine: dict) -> None:
         app.state.store.end_session(session_id)
 
 
-async def _reminder_loop(app: FastAPI) -> None:
-    """Fire due reminders and routines: WS event + toast + spoken when voice on."""
-    import asyncio
+async def _announce_reminders(app: FastAPI) -> None:
+    """Toast + speak fired reminders one at a time, off the scheduler loop.
 
+    Each toast is a PowerShell launch and speech lasts as long as the sentence,
+    so awaiting them inline would hold the scheduler back for seconds. A single
+    consumer drains app.state.announce_queue so reminders fired in separate
+    passes still never talk over each other.
+    """
     from .notify import toast
 
+    queue: asyncio.Queue[str] = app.state.announce_queue
     while True:
-        await asyncio.sleep(10)
+        text = await queue.get()
+        try:
+            await asyncio.to_thread(toast, "Sentinel reminder", text)
+            voice = app.state.voice
+            if voice is not None and voice.running:
+                from .voice.tts import Speaker
+
+                speaker = Speaker()
+                try:
+                    await speaker.speak(f"Reminder: {text}")
+                finally:
+                    speaker.close()
+        except Exception:  # noqa: BLE001
+            logger.exception("Reminder announcement failed")
+
+
+# Routines are matched to the minute, so the scheduler never sleeps longer than
+# this; reminders wake it at their exact due time instead.
+_SCHEDULER_POLL = 10.0
+
+
+async def _reminder_loop(app: FastAPI) -> None:
+    """Fire due reminders and routines: WS event + toast + spoken when voice on.
+
+    One task sleeps until the earliest pending reminder (capped at
+    _SCHEDULER_POLL); app.state.reminder_wake cuts the sleep short when a new
+    reminder is added, so a 30-second timer fires on time rather than up to a
+    poll interval late.
+    """
+    wake: asyncio.Event = app.state.reminder_wake
+    while True:
+        delay = _SCHEDULER_POLL
+        try:
+            next_due = app.state.store.next_reminder_due()
+        except Exception:  # noqa: BLE001 — fall back to polling
+            logger.exception("Could not read the next reminder time")
+            next_due = None
+        if next_due is not None:
+            # Floor so a reminder that keeps failing to fire cannot spin the loop.
+            delay = min(delay, max(0.25, next_due - time.time()))
+        try:
+            await asyncio.wait_for(wake.wait(), delay)
+        except TimeoutError:
+            pass
+        wake.clear()
         try:
             for routine in app.state.store.due_routines():
                 app.state.store.mark_routine_run(routine["name"])
@@ -97,24 +145,13 @@ async def _reminder_loop(app: FastAPI) -> None:
                         data={"id": reminder["id"], "text": reminder["text"]},
                     )
                 )
-                await asyncio.to_thread(toast, "Sentinel reminder", reminder["text"])
-                voice = app.state.voice
-                if voice is not None and voice.running:
-                    from .voice.tts import Speaker
-
-                    speaker = Speaker()
-                    try:
-                        await speaker.speak(f"Reminder: {reminder['text']}")
-                    finally:
-                        speaker.close()
+                app.state.announce_queue.put_nowait(reminder["text"])
         except Exception:  # noqa: BLE001 — the loop must survive anything
             logger.exception("Reminder loop iteration failed")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    import asyncio
-
     store = Store()
     app.state.store = store
     app.state.chat = ChatService(load_settings(store), store)
@@ -123,14 +160,27 @@ async def lifespan(app: FastAPI):
     pruned = store.prune_memory()
     if pruned:
         logger.info("Pruned %d expired memory rows", pruned)
+    app.state.reminder_wake = asyncio.Event()
+    from .tools import productivity
+
+    loop = asyncio.get_running_loop()
+    productivity.on_schedule_change = lambda: loop.call_soon_threadsafe(app.state.reminder_wake.set)
+    app.state.announce_queue = asyncio.Queue()
+    announce_task = asyncio.create_task(_announce_reminders(app), name="reminder-announce")
     reminder_task = asyncio.create_task(_reminder_loop(app), name="reminders")
     # Warm the embedding model off the critical path (first run downloads it).
     from . import embeddings
 
     asyncio.create_task(asyncio.to_thread(embeddings.warmup), name="embed-warmup")
+    # Likewise pre-connect Spotify (token refresh + TLS) when it is authorized.
+    from .tools import music
+
+    asyncio.create_task(asyncio.to_thread(music.warmup), name="spotify-warmup")
     logger.info("Sentinel Core %s ready", __version__)
     yield
     reminder_task.cancel()
+    announce_task.cancel()
+    productivity.on_schedule_change = None
     if app.state.voice is not None:
         await app.state.voice.stop()
     await app.state.chat.aclose()
@@ -373,7 +423,6 @@ async def voice_status():
 @app.get("/system/apps")
 async def installed_apps():
     """Installed/startable apps via Get-StartApps (for the Workspaces picker)."""
-    import asyncio as _asyncio
     import json as _json
     import subprocess
 
@@ -395,7 +444,7 @@ async def installed_apps():
         return [{"name": a["Name"], "app_id": a["AppID"]} for a in apps]
 
     try:
-        return sorted(await _asyncio.to_thread(_run), key=lambda a: a["name"].lower())
+        return sorted(await asyncio.to_thread(_run), key=lambda a: a["name"].lower())
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(500, f"Could not enumerate apps: {exc}") from exc
 
@@ -3,7 +3,8 @@
 Single flow, file-based: client secrets from ``data_dir()/credentials.json``
 (falling back to the legacy frontend copy), user token cached at
 ``data_dir()/google_token.json``. Expired tokens are refreshed silently; the
-interactive browser flow runs only when no usable token exists.
+interactive browser flow runs only when no usable token exists. API clients
+are reused per thread via ``cached_service``.
 """
 
 from __future__ import annotations
@@ -11,7 +12,9 @@ from __future__ import annotations
 import json
 import logging
 import threading
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -20,8 +23,15 @@ from sentinel_core.config import data_dir
 
 logger = logging.getLogger(__name__)
 
+# googleapiclient's discovery-cache autodetect logs an oauth2client notice on
+# every client build; keep it out of the service log.
+logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
+
 # Serialize token refresh / interactive flows across executor threads.
 _lock = threading.Lock()
+# API clients per worker thread (httplib2 connections are not thread-safe),
+# keyed by API name, as {api: (service, credentials)}.
+_local = threading.local()
 
 
 def _token_path() -> Path:
@@ -93,3 +103,22 @@ def get_credentials(scopes: list[str]) -> Credentials:
             logger.info("Google OAuth completed; token cached at %s", token_path)
 
         return creds
+
+
+def cached_service(api: str, scopes: list[str], build: Callable[[Credentials], Any]) -> Any:
+    """Return the calling thread's client for ``api``, building it on first use.
+
+    Reuse keeps the TLS connection to googleapis.com alive across tool calls;
+    ``build(creds)`` runs again once the cached client's credentials stop being
+    valid.
+    """
+    services: dict[str, tuple[Any, Credentials]] | None = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+    cached = services.get(api)
+    if cached is not None and cached[1].valid:
+        return cached[0]
+    creds = get_credentials(scopes)
+    service = build(creds)
+    services[api] = (service, creds)
+    return service
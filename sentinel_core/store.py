@@ -196,6 +196,11 @@ class Store:
         )
         return [dict(r) for r in rows]
 
+    def next_reminder_due(self) -> float | None:
+        """Due time of the earliest unfired reminder, or None if there is none."""
+        rows = self._query("SELECT MIN(due_at) FROM reminders WHERE fired=0")
+        return rows[0][0] if rows else None
+
     def mark_reminder_fired(self, reminder_id: int) -> None:
         self._execute("UPDATE reminders SET fired=1 WHERE id=?", (reminder_id,))
 
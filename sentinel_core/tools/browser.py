@@ -12,7 +12,6 @@ import time
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 from langchain_core.tools import tool
 
 from sentinel_core.config import get_secret
@@ -28,6 +27,29 @@ _HEADERS = {
     )
 }
 _TAVILY_URL = "https://api.tavily.com/search"
+# read_webpage keeps ~2000 chars of text; stop downloading pages well past that.
+_MAX_PAGE_BYTES = 2_000_000
+
+_CONNECT_RETRIES = 2
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """One pooled client for every tool, so repeat calls reuse TCP+TLS connections.
+
+    The transport retries failed connects (DNS blips, resets while a pooled
+    connection goes stale) before a tool gives up with an error string. Status
+    codes are never retried here; each tool decides what a 4xx/5xx means.
+    """
+    global _client
+    if _client is None:
+        transport = httpx.AsyncHTTPTransport(
+            retries=_CONNECT_RETRIES,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=8),
+        )
+        _client = httpx.AsyncClient(timeout=_TIMEOUT, transport=transport)
+    return _client
 
 
 async def _tavily(query: str, max_results: int) -> list[dict] | str:
@@ -36,14 +58,13 @@ async def _tavily(query: str, max_results: int) -> list[dict] | str:
     if not api_key:
         return "Tavily API key is not configured (set TAVILY_API_KEY)."
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.post(
-                _TAVILY_URL,
-                headers={"Authorization": f"Bearer {api_key}"},
-                json={"query": query, "max_results": max_results},
-            )
-            resp.raise_for_status()
-            return resp.json().get("results", [])
+        resp = await _get_client().post(
+            _TAVILY_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={"query": query, "max_results": max_results},
+        )
+        resp.raise_for_status()
+        return resp.json().get("results", [])
     except httpx.TimeoutException:
         return "Web search timed out. Please try again."
     except httpx.HTTPError as exc:
@@ -95,11 +116,15 @@ async def read_webpage(url: str) -> str:
     if not parsed.scheme or not parsed.netloc:
         return "Invalid URL. Please include http:// or https://."
     try:
-        async with httpx.AsyncClient(
-            headers=_HEADERS, timeout=_TIMEOUT, follow_redirects=True
-        ) as client:
-            resp = await client.get(url)
+        body = bytearray()
+        async with _get_client().stream(
+            "GET", url, headers=_HEADERS, follow_redirects=True
+        ) as resp:
             resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                body.extend(chunk)
+                if len(body) >= _MAX_PAGE_BYTES:
+                    break
     except httpx.TimeoutException:
         return f"Timeout: the webpage took too long to respond ({url})."
     except httpx.HTTPError as exc:
@@ -107,7 +132,14 @@ async def read_webpage(url: str) -> str:
         return f"Error accessing webpage: {exc}"
 
     try:
-        soup = BeautifulSoup(resp.content, "html.parser")
+        from bs4 import BeautifulSoup, FeatureNotFound  # lazy: only read_webpage parses HTML
+
+        try:
+            # lxml (C parser, installed with python-docx) is several times faster
+            # than the pure-Python html.parser on large pages.
+            soup = BeautifulSoup(bytes(body), "lxml")
+        except FeatureNotFound:
+            soup = BeautifulSoup(bytes(body), "html.parser")
         title_tag = soup.find("title")
         title = title_tag.get_text().strip() if title_tag else "No title"
 
@@ -140,10 +172,9 @@ async def get_weather(location: str) -> str:
         location: City or place name, e.g. "London" or "New York".
     """
     try:
-        async with httpx.AsyncClient(headers=_HEADERS, timeout=_TIMEOUT) as client:
-            resp = await client.get(f"https://wttr.in/{location}?format=j1")
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(f"https://wttr.in/{location}?format=j1", headers=_HEADERS)
+        resp.raise_for_status()
+        data = resp.json()
 
         current = data["current_condition"][0]
         area = data["nearest_area"][0]
@@ -174,10 +205,9 @@ async def get_weather_forecast(location: str, days: int = 3) -> str:
     """
     days = max(1, min(3, days))
     try:
-        async with httpx.AsyncClient(headers=_HEADERS, timeout=_TIMEOUT) as client:
-            resp = await client.get(f"https://wttr.in/{location}?format=j1")
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(f"https://wttr.in/{location}?format=j1", headers=_HEADERS)
+        resp.raise_for_status()
+        data = resp.json()
 
         area = data["nearest_area"][0]
         name = area["areaName"][0]["value"]
@@ -223,13 +253,12 @@ async def translate_text(text: str, target_language: str = "en") -> str:
         target_language: Target language code, e.g. "en", "es", "fr", "ja".
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(
-                "https://api.mymemory.translated.net/get",
-                params={"q": text, "langpair": f"auto|{target_language}"},
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(
+            "https://api.mymemory.translated.net/get",
+            params={"q": text, "langpair": f"auto|{target_language}"},
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         if data.get("responseStatus") == 200:
             translated = data["responseData"]["translatedText"]
@@ -255,13 +284,12 @@ async def convert_currency(amount: float, from_currency: str, to_currency: str)
     from_code = from_currency.upper().strip()
     to_code = to_currency.upper().strip()
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(
-                "https://api.frankfurter.app/latest",
-                params={"amount": amount, "from": from_code, "to": to_code},
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(
+            "https://api.frankfurter.app/latest",
+            params={"amount": amount, "from": from_code, "to": to_code},
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         rates = data.get("rates", {})
         if to_code not in rates:
@@ -287,12 +315,11 @@ async def get_definition(word: str) -> str:
         word: The word to define.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}")
-            if resp.status_code == 404:
-                return f"Word '{word}' not found in the dictionary."
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}")
+        if resp.status_code == 404:
+            return f"Word '{word}' not found in the dictionary."
+        resp.raise_for_status()
+        data = resp.json()
 
         if not data:
             return f"No definition found for '{word}'."
@@ -324,8 +351,7 @@ async def check_website_status(url: str) -> str:
         url = f"https://{url}"
     try:
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=_TIMEOUT, follow_redirects=True) as client:
-            resp = await client.get(url)
+        resp = await _get_client().get(url, follow_redirects=True)
         elapsed_ms = (time.monotonic() - start) * 1000
         return (
             f"{url} is online (HTTP {resp.status_code}), "
@@ -348,9 +374,10 @@ async def shorten_url(long_url: str) -> str:
         long_url: The URL to shorten.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get("https://tinyurl.com/api-create.php", params={"url": long_url})
-            resp.raise_for_status()
+        resp = await _get_client().get(
+            "https://tinyurl.com/api-create.php", params={"url": long_url}
+        )
+        resp.raise_for_status()
         return f"Shortened URL: {resp.text.strip()}"
     except httpx.TimeoutException:
         return "URL shortener timed out. Please try again."
@@ -372,38 +399,40 @@ async def search_wikipedia(query: str, sentences: int = 5) -> str:
     sentences = max(1, min(10, sentences))
     api_url = "https://en.wikipedia.org/w/api.php"
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT, headers=_HEADERS) as client:
-            search_resp = await client.get(
-                api_url,
-                params={
-                    "action": "query",
-                    "list": "search",
-                    "srsearch": query,
-                    "format": "json",
-                    "srlimit": 1,
-                },
-            )
-            search_resp.raise_for_status()
-            hits = search_resp.json().get("query", {}).get("search", [])
-            if not hits:
-                return f"No Wikipedia article found for: {query}"
-            title = hits[0]["title"]
-
-            extract_resp = await client.get(
-                api_url,
-                params={
-                    "action": "query",
-                    "titles": title,
-                    "prop": "extracts",
-                    "exsentences": sentences,
-                    "exintro": True,
-                    "explaintext": True,
-                    "format": "json",
-                },
-            )
-            extract_resp.raise_for_status()
-            pages = extract_resp.json().get("query", {}).get("pages", {})
-            extract = next(iter(pages.values())).get("extract", "No content available.")
+        client = _get_client()
+        search_resp = await client.get(
+            api_url,
+            headers=_HEADERS,
+            params={
+                "action": "query",
+                "list": "search",
+                "srsearch": query,
+                "format": "json",
+                "srlimit": 1,
+            },
+        )
+        search_resp.raise_for_status()
+        hits = search_resp.json().get("query", {}).get("search", [])
+        if not hits:
+            return f"No Wikipedia article found for: {query}"
+        title = hits[0]["title"]
+
+        extract_resp = await client.get(
+            api_url,
+            headers=_HEADERS,
+            params={
+                "action": "query",
+                "titles": title,
+                "prop": "extracts",
+                "exsentences": sentences,
+                "exintro": True,
+                "explaintext": True,
+                "format": "json",
+            },
+        )
+        extract_resp.raise_for_status()
+        pages = extract_resp.json().get("query", {}).get("pages", {})
+        extract = next(iter(pages.values())).get("extract", "No content available.")
 
         link = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
         return f"Wikipedia: {title}\n\n{extract}\n\nRead more: {link}"
@@ -423,10 +452,11 @@ async def get_stock_price(ticker: str) -> str:
     """
     ticker = ticker.upper().strip()
     try:
-        async with httpx.AsyncClient(headers=_HEADERS, timeout=_TIMEOUT) as client:
-            resp = await client.get(f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}")
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().get(
+            f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}", headers=_HEADERS
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         result = data.get("chart", {}).get("result") or []
         if not result:
@@ -466,20 +496,19 @@ async def search_reddit(query: str, subreddit: str = "", limit: int = 5) -> str:
         else "https://www.reddit.com/search.json"
     )
     try:
-        async with httpx.AsyncClient(
-            headers={"User-Agent": "SentinelAI/1.0"}, timeout=_TIMEOUT, follow_redirects=True
-        ) as client:
-            resp = await client.get(
-                base_url,
-                params={
-                    "q": query,
-                    "sort": "relevance",
-                    "limit": limit,
-                    "restrict_sr": bool(subreddit),
-                },
-            )
-            resp.raise_for_status()
-            posts = resp.json().get("data", {}).get("children", [])
+        resp = await _get_client().get(
+            base_url,
+            params={
+                "q": query,
+                "sort": "relevance",
+                "limit": limit,
+                "restrict_sr": bool(subreddit),
+            },
+            headers={"User-Agent": "SentinelAI/1.0"},
+            follow_redirects=True,
+        )
+        resp.raise_for_status()
+        posts = resp.json().get("data", {}).get("children", [])
 
         if not posts:
             return f"No Reddit posts found for: {query}"
@@ -25,14 +25,17 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.compose",
 ]
 
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
 
 def _service():
-    """Build a Gmail API client (lazy — never at import time)."""
+    """Gmail API client (lazy — never at import time), reused per thread."""
     from googleapiclient.discovery import build
 
-    from sentinel_core.google_auth import get_credentials
+    from sentinel_core.google_auth import cached_service
 
-    return build("gmail", "v1", credentials=get_credentials(SCOPES))
+    return cached_service("gmail", SCOPES, lambda creds: build("gmail", "v1", credentials=creds))
 
 
 def _err(action: str, exc: Exception) -> str:
@@ -69,7 +72,7 @@ def _decode_body(payload: dict) -> str:
         return base64.urlsafe_b64decode(data + "==").decode("utf-8", errors="replace")
     if mime_type == "text/html" and data:
         html = base64.urlsafe_b64decode(data + "==").decode("utf-8", errors="replace")
-        return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", html)).strip()
+        return _WHITESPACE.sub(" ", _HTML_TAG.sub(" ", html)).strip()
     for part in payload.get("parts", []):
         if body := _decode_body(part):
             return body
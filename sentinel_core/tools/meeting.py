@@ -18,14 +18,36 @@ SCOPES = [
     "https://www.googleapis.com/auth/calendar.events",
 ]
 
+_discovery: str | None = None
+
+
+def _discovery_doc() -> str | None:
+    """Calendar v3 discovery document, read once from googleapiclient's bundled copy."""
+    global _discovery
+    if _discovery is None:
+        from googleapiclient.discovery_cache import get_static_doc
+
+        _discovery = get_static_doc("calendar", "v3")
+    return _discovery
+
 
 def _service():
-    """Build a Calendar API client (lazy — never at import time)."""
-    from googleapiclient.discovery import build
+    """Calendar API client (lazy — never at import time), reused per thread.
+
+    Built from the cached bundled discovery document, so construction touches
+    neither the network nor the disk after the first call.
+    """
+    from googleapiclient.discovery import build, build_from_document
+
+    from sentinel_core.google_auth import cached_service
 
-    from sentinel_core.google_auth import get_credentials
+    def make(creds):
+        doc = _discovery_doc()
+        if doc is None:  # bundled copy missing in this googleapiclient build
+            return build("calendar", "v3", credentials=creds)
+        return build_from_document(doc, credentials=creds)
 
-    return build("calendar", "v3", credentials=get_credentials(SCOPES))
+    return cached_service("calendar", SCOPES, make)
 
 
 def _err(action: str, exc: Exception) -> str:
@@ -8,21 +8,64 @@ as short strings, never tracebacks.
 
 from __future__ import annotations
 
+import functools
 import logging
 import threading
-from typing import Any
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, ParamSpec
 
 from langchain_core.tools import tool
 
 from sentinel_core.config import data_dir, get_secret
 
+if TYPE_CHECKING:
+    import requests
+    from urllib3.response import BaseHTTPResponse
+
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+
 SCOPES = "user-read-playback-state user-modify-playback-state"
 
 _client_lock = threading.Lock()
 _client: Any = None
 
+# 429 handling: honour Retry-After with exponential backoff, but never park a
+# tool call for longer than this per attempt.
+_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER = 8.0
+
+# Last current_playback() result as (monotonic time, playback). Reused while the
+# track it describes is still playing — never past its end, never longer than
+# _PLAYBACK_TTL so changes made from another Spotify client show up quickly.
+_PLAYBACK_TTL = 15.0
+_playback_cache: tuple[float, dict[str, Any] | None] | None = None
+
+# Last device _pick_device resolved, as (monotonic time, device id). Only
+# set_volume reuses it (right after a play it targets the same device); a
+# stale id fails with 404, which drops the entry (see _err).
+_DEVICE_TTL = 60.0
+_device_cache: tuple[float, str] | None = None
+# Last sp.devices() listing, as (monotonic time, devices). Only used to match
+# device names; is_active goes stale as soon as playback moves elsewhere.
+_DEVICES_TTL = 30.0
+_devices_cache: tuple[float, list[dict[str, Any]]] | None = None
+
+# sp.search() results by (item_type, query), as (monotonic time, results). The
+# agent often repeats a search within a session (retries, "play that again").
+_SEARCH_TTL = 300.0
+_SEARCH_CACHE_MAX = 128
+_search_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+_ITEM_TYPES = frozenset({"track", "artist", "album", "playlist"})
+_ITEM_TYPE_ALIASES = {"song": "track"}
+
+# Overlaps independent Spotify requests within one tool call.
+_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="spotify")
+
 
 def token_cache_path() -> str:
     return str(data_dir() / "spotify_token.json")
@@ -59,6 +102,39 @@ def is_authorized() -> bool:
         return False
 
 
+def _http_session() -> requests.Session:
+    """requests session for spotipy that waits out 429s for a bounded time.
+
+    spotipy's own adapter already retries 429s, but sleeps for whatever
+    Retry-After says — Spotify has sent values of hours — which wedges the
+    agent until its timeout and then the supervisor retries into the same
+    limit. Cap each wait so a rate limit costs seconds, then surfaces as an error.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class _CappedRetry(Retry):
+        def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+            retry_after = super().get_retry_after(response)
+            return None if retry_after is None else min(retry_after, _MAX_RETRY_AFTER)
+
+    retry = _CappedRetry(
+        total=_RATE_LIMIT_RETRIES,
+        connect=None,
+        read=False,
+        status=_RATE_LIMIT_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _spotify():
     """Return a cached spotipy client (lazy — never created at import time).
 
@@ -67,8 +143,14 @@ def _spotify():
     inside a tool call means the agent times out and the supervisor retries,
     opening a browser tab per attempt. Authorization is an explicit user action
     via POST /connections/spotify/authorize instead.
+
+    The hit path is a plain read; the lock (and the keyring + token-cache reads
+    behind build_auth_manager/is_authorized) is only taken to build the client.
     """
     global _client
+    client = _client
+    if client is not None:
+        return client
     with _client_lock:
         if _client is not None:
             return _client
@@ -86,15 +168,39 @@ def _spotify():
                 "Spotify is configured but not authorized yet. Open Connections in "
                 "Sentinel and click Authorize to sign in once."
             )
-        _client = spotipy.Spotify(auth_manager=auth)
+        # spotipy's untyped default (requests_session=True) makes pyright infer bool;
+        # a Session instance is the documented alternative.
+        session = _http_session()
+        _client = spotipy.Spotify(
+            auth_manager=auth,
+            requests_session=session,  # pyright: ignore[reportArgumentType]
+        )
         return _client
 
 
+def warmup() -> None:
+    """Build the client and open the api.spotify.com connection before first use.
+
+    Refreshes the token and leaves a live TLS connection in the session pool so
+    the first "play ..." of a session skips DNS + handshake + token refresh.
+    Best-effort and blocking — run it in a thread. A no-op when Spotify is not
+    set up, without importing spotipy.
+    """
+    if not get_secret("SPOTIPY_CLIENT_ID"):
+        return
+    try:
+        _devices(_spotify(), fresh=True)
+    except Exception as exc:  # noqa: BLE001 — warmup must never fail startup
+        logger.info("Spotify warmup skipped: %s", exc)
+
+
 def reset_client() -> None:
     """Drop the cached client so the next call picks up a new token."""
     global _client
     with _client_lock:
         _client = None
+    _forget_playback()
+    _forget_device()
 
 
 def _err(action: str, exc: Exception) -> str:
@@ -106,9 +212,17 @@ def _err(action: str, exc: Exception) -> str:
         return str(exc)
     if isinstance(exc, SpotifyException):
         msg = str(exc.msg or "")
-        if "PREMIUM_REQUIRED" in msg or exc.reason == "PREMIUM_REQUIRED":
+        reason = str(exc.reason or "")
+        if "PREMIUM_REQUIRED" in msg or reason == "PREMIUM_REQUIRED":
             return "This playback control requires a Spotify Premium subscription."
-        if "NO_ACTIVE_DEVICE" in msg or exc.reason == "NO_ACTIVE_DEVICE" or exc.http_status == 404:
+        if exc.http_status == 429:
+            # spotipy also reports retries exhausted on 5xx as HTTP 429 "Max Retries";
+            # only the urllib3 reason says which status kept coming back.
+            if "Max Retries" in msg and "429" not in reason:
+                return "Spotify is having trouble right now. Try again in a minute."
+            return "Spotify is rate-limiting requests right now. Try again in a minute."
+        if "NO_ACTIVE_DEVICE" in msg or reason == "NO_ACTIVE_DEVICE" or exc.http_status == 404:
+            _forget_device()
             return (
                 "No active Spotify device. Open Spotify on a device, or use list_devices "
                 "and play_on_device to pick one."
@@ -117,6 +231,26 @@ def _err(action: str, exc: Exception) -> str:
     return f"Could not {action}: {type(exc).__name__}: {exc}"
 
 
+def _spotify_tool(action: str) -> Callable[[Callable[P, str]], Callable[P, str]]:
+    """Decorator for tool bodies: any exception becomes a short _err() string.
+
+    Keeps each tool down to its happy path; the client cache, 429 handling and
+    playback cache underneath are shared the same way by every tool.
+    """
+
+    def decorate(fn: Callable[P, str]) -> Callable[P, str]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> str:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as exc:
+                return _err(action, exc)
+
+        return wrapper
+
+    return decorate
+
+
 def _describe_devices(devices: list[dict]) -> str:
     lines = []
     for d in devices:
@@ -125,25 +259,55 @@ def _describe_devices(devices: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def _pick_device(sp: Any) -> tuple[str | None, str]:
+def _remember_device(device_id: str) -> None:
+    global _device_cache
+    _device_cache = (time.monotonic(), device_id)
+
+
+def _forget_device() -> None:
+    global _device_cache, _devices_cache
+    _device_cache = None
+    _devices_cache = None
+
+
+def _devices(sp: Any, fresh: bool = False) -> list[dict[str, Any]]:
+    """sp.devices() listing, reused for _DEVICES_TTL seconds unless ``fresh``."""
+    global _devices_cache
+    cached = _devices_cache
+    if not fresh and cached is not None and time.monotonic() - cached[0] < _DEVICES_TTL:
+        return cached[1]
+    listing: dict[str, Any] = sp.devices() or {}
+    devices: list[dict[str, Any]] = listing.get("devices", [])
+    _devices_cache = (time.monotonic(), devices)
+    return devices
+
+
+def _pick_device(sp: Any, reuse_recent: bool = False) -> tuple[str | None, str]:
     """Choose a playback device id.
 
-    Order: the active device, else a device of type "Computer". If neither
-    exists, return (None, message listing the devices) instead of blindly
-    playing on an arbitrary device (legacy wrong-device bug).
+    Order: the active device, else a device of type "Computer". If none exists,
+    return (None, message listing the devices) instead of blindly playing on an
+    arbitrary device (legacy wrong-device bug). With ``reuse_recent``, a device
+    resolved within the last _DEVICE_TTL seconds is returned without a lookup;
+    only use it where acting on the previous device is harmless.
     """
-    devices = (sp.devices() or {}).get("devices", [])
+    cached = _device_cache
+    if reuse_recent and cached is not None and time.monotonic() - cached[0] < _DEVICE_TTL:
+        return cached[1], ""
+    # Always live: a cached is_active would send playback back to a device the
+    # user has since left.
+    devices = _devices(sp, fresh=True)
     if not devices:
         return None, (
             "No Spotify devices found. Open the Spotify app on your computer or "
             "phone, then try again."
         )
-    for d in devices:
-        if d.get("is_active"):
-            return d["id"], ""
-    for d in devices:
-        if d.get("type") == "Computer":
-            return d["id"], f" (started on this computer: {d.get('name', '?')})"
+    if active := next((d for d in devices if d.get("is_active")), None):
+        _remember_device(active["id"])
+        return active["id"], ""
+    if computer := next((d for d in devices if d.get("type") == "Computer"), None):
+        _remember_device(computer["id"])
+        return computer["id"], f" (started on this computer: {computer.get('name', '?')})"
     return None, (
         "No active Spotify device and no computer device available. "
         "Available devices:\n"
@@ -152,15 +316,77 @@ def _pick_device(sp: Any) -> tuple[str | None, str]:
     )
 
 
-def _now_playing(sp: Any) -> str:
-    playback = sp.current_playback()
-    item = (playback or {}).get("item")
+def _search(sp: Any, query: str, item_type: str) -> dict[str, Any]:
+    """Top sp.search() hit for ``query``, reused for _SEARCH_TTL seconds."""
+    key = (item_type, " ".join(query.lower().split()))
+    now = time.monotonic()
+    cached = _search_cache.get(key)
+    if cached is not None and now - cached[0] < _SEARCH_TTL:
+        return cached[1]
+    results: dict[str, Any] = sp.search(q=query, type=item_type, limit=1)
+    if len(_search_cache) >= _SEARCH_CACHE_MAX:
+        _search_cache.pop(next(iter(_search_cache)), None)
+    _search_cache[key] = (now, results)
+    return results
+
+
+def _describe_item(item: dict[str, Any] | None) -> str:
     if not item:
         return ""
-    return f"'{item['name']}' by {item['artists'][0]['name']}"
+    artists: list[dict[str, Any]] = item.get("artists") or []
+    return f"'{item['name']}' by {artists[0]['name']}" if artists else f"'{item['name']}'"
+
+
+def _current_playback(sp: Any, fresh: bool = False) -> dict[str, Any] | None:
+    """current_playback(), served from cache while the cached track is still playing."""
+    global _playback_cache
+    now = time.monotonic()
+    cached = _playback_cache
+    if not fresh and cached is not None:
+        fetched_at, playback = cached
+        item = (playback or {}).get("item")
+        if playback and item and playback.get("is_playing"):
+            elapsed = now - fetched_at
+            progress = playback.get("progress_ms") or 0
+            remaining_s = ((item.get("duration_ms") or 0) - progress - 500) / 1000
+            if elapsed < min(_PLAYBACK_TTL, remaining_s):
+                return {**playback, "progress_ms": progress + int(elapsed * 1000)}
+    playback: dict[str, Any] | None = sp.current_playback()
+    _playback_cache = (now, playback)
+    return playback
+
+
+def _forget_playback() -> None:
+    """Invalidate the playback cache after anything that changes playback."""
+    global _playback_cache
+    _playback_cache = None
+
+
+def _now_playing(sp: Any, playback: dict[str, Any] | None = None) -> str:
+    """Describe the current track, reusing ``playback`` when the caller already has it."""
+    if playback is None:
+        playback = _current_playback(sp)
+    return _describe_item((playback or {}).get("item"))
+
+
+def _up_next(sp: Any) -> dict[str, Any] | None:
+    """First item of the queue, read before skipping.
+
+    current_playback() right after next_track() often still reports the old
+    track (Spotify applies the skip asynchronously); the queue head is what the
+    skip resolves to. Best effort — a failed peek must not block the skip.
+    """
+    try:
+        listing: dict[str, Any] = sp.queue() or {}
+        queue: list[dict[str, Any]] = listing.get("queue") or []
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Spotify queue peek failed: %s", exc)
+        return None
+    return queue[0] if queue else None
 
 
 @tool
+@_spotify_tool("play music")
 def search_and_play(query: str, item_type: str = "track") -> str:
     """Search Spotify and start playback of the best match.
 
@@ -168,151 +394,144 @@ def search_and_play(query: str, item_type: str = "track") -> str:
         query: What to play, e.g. "Bohemian Rhapsody Queen" or "lofi beats playlist".
         item_type: One of "track" (a song), "artist", "album", or "playlist".
     """
-    try:
-        item_type = {"song": "track"}.get(item_type.lower().strip(), item_type.lower().strip())
-        if item_type not in ("track", "artist", "album", "playlist"):
-            return "item_type must be one of: track, artist, album, playlist."
-        if not query.strip():
-            return "A search query is required."
-        sp = _spotify()
-        device_id, note = _pick_device(sp)
-        if device_id is None:
-            return note
-        results = sp.search(q=query, type=item_type, limit=1)
-        items = [i for i in results[item_type + "s"]["items"] if i]
-        if not items:
-            return f"No {item_type} found on Spotify for '{query}'."
-        item = items[0]
-        name = item["name"]
-        if item_type == "track":
-            sp.start_playback(device_id=device_id, uris=[item["uri"]])
-            played = f"'{name}' by {item['artists'][0]['name']}"
-        else:
-            sp.start_playback(device_id=device_id, context_uri=item["uri"])
-            played = f"{item_type} '{name}'"
-        return f"Now playing {played}.{note}"
-    except Exception as exc:
-        return _err("play music", exc)
+    item_type = item_type.lower().strip()
+    item_type = _ITEM_TYPE_ALIASES.get(item_type, item_type)
+    if item_type not in _ITEM_TYPES:
+        return "item_type must be one of: track, artist, album, playlist."
+    if not query.strip():
+        return "A search query is required."
+    sp = _spotify()
+    # The search does not depend on the device, so run both round-trips at once.
+    search = _pool.submit(_search, sp, query, item_type)
+    device_id, note = _pick_device(sp)
+    if device_id is None:
+        return note
+    results = search.result()
+    items = [i for i in results[item_type + "s"]["items"] if i]
+    if not items:
+        return f"No {item_type} found on Spotify for '{query}'."
+    item = items[0]
+    name = item["name"]
+    if item_type == "track":
+        sp.start_playback(device_id=device_id, uris=[item["uri"]])
+        played = f"'{name}' by {item['artists'][0]['name']}"
+    else:
+        sp.start_playback(device_id=device_id, context_uri=item["uri"])
+        played = f"{item_type} '{name}'"
+    _forget_playback()
+    return f"Now playing {played}.{note}"
 
 
 @tool
+@_spotify_tool("pause music")
 def pause_music() -> str:
     """Pause the current Spotify playback."""
-    try:
-        sp = _spotify()
-        playback = sp.current_playback()
-        if not playback or not playback.get("is_playing"):
-            return "Nothing is currently playing on Spotify."
-        sp.pause_playback()
-        track = _now_playing(sp)
-        return f"Paused {track}." if track else "Playback paused."
-    except Exception as exc:
-        return _err("pause music", exc)
+    sp = _spotify()
+    playback = _current_playback(sp, fresh=True)
+    if not playback or not playback.get("is_playing"):
+        return "Nothing is currently playing on Spotify."
+    sp.pause_playback()
+    _forget_playback()
+    track = _now_playing(sp, playback)
+    return f"Paused {track}." if track else "Playback paused."
 
 
 @tool
+@_spotify_tool("resume music")
 def resume_music() -> str:
     """Resume paused Spotify playback."""
-    try:
-        sp = _spotify()
-        playback = sp.current_playback()
-        if playback and playback.get("is_playing"):
-            track = _now_playing(sp)
-            return f"Music is already playing: {track}." if track else "Music is already playing."
-        if playback and playback.get("device"):
-            sp.start_playback()
-            return "Playback resumed."
-        device_id, note = _pick_device(sp)
-        if device_id is None:
-            return note
-        sp.start_playback(device_id=device_id)
-        return f"Playback resumed.{note}"
-    except Exception as exc:
-        return _err("resume music", exc)
+    sp = _spotify()
+    playback = _current_playback(sp, fresh=True)
+    if playback and playback.get("is_playing"):
+        track = _now_playing(sp, playback)
+        return f"Music is already playing: {track}." if track else "Music is already playing."
+    if playback and playback.get("device"):
+        sp.start_playback()
+        _forget_playback()
+        return "Playback resumed."
+    device_id, note = _pick_device(sp)
+    if device_id is None:
+        return note
+    sp.start_playback(device_id=device_id)
+    _forget_playback()
+    return f"Playback resumed.{note}"
 
 
 @tool
+@_spotify_tool("skip to the next track")
 def next_track() -> str:
     """Skip to the next track in the Spotify queue."""
-    try:
-        sp = _spotify()
-        sp.next_track()
-        track = _now_playing(sp)
-        return f"Skipped to {track}." if track else "Skipped to the next track."
-    except Exception as exc:
-        return _err("skip to the next track", exc)
+    sp = _spotify()
+    upcoming = _up_next(sp)
+    sp.next_track()
+    _forget_playback()
+    track = _describe_item(upcoming)
+    return f"Skipped to {track}." if track else "Skipped to the next track."
 
 
 @tool
+@_spotify_tool("go to the previous track")
 def previous_track() -> str:
     """Go back to the previous track in the Spotify queue."""
-    try:
-        sp = _spotify()
-        sp.previous_track()
-        track = _now_playing(sp)
-        return f"Went back to {track}." if track else "Went back to the previous track."
-    except Exception as exc:
-        return _err("go to the previous track", exc)
+    sp = _spotify()
+    sp.previous_track()
+    _forget_playback()
+    return "Went back to the previous track."
 
 
 @tool
+@_spotify_tool("set the volume")
 def set_volume(volume_percent: int) -> str:
     """Set the Spotify playback volume (requires Premium).
 
     Args:
         volume_percent: Volume level from 0 to 100.
     """
-    try:
-        if not 0 <= volume_percent <= 100:
-            return "Volume must be between 0 and 100."
-        sp = _spotify()
-        device_id, note = _pick_device(sp)
-        if device_id is None:
-            return note
-        sp.volume(volume_percent, device_id=device_id)
-        return f"Volume set to {volume_percent}%.{note}"
-    except Exception as exc:
-        return _err("set the volume", exc)
+    if not 0 <= volume_percent <= 100:
+        return "Volume must be between 0 and 100."
+    sp = _spotify()
+    device_id, note = _pick_device(sp, reuse_recent=True)
+    if device_id is None:
+        return note
+    sp.volume(volume_percent, device_id=device_id)
+    return f"Volume set to {volume_percent}%.{note}"
 
 
 @tool
+@_spotify_tool("get the current track")
 def current_track() -> str:
     """Get the currently playing Spotify track with album and progress."""
-    try:
-        sp = _spotify()
-        playback = sp.current_playback()
-        if not playback or not playback.get("item"):
-            return "Nothing is playing on Spotify right now."
-        item = playback["item"]
-        progress = playback.get("progress_ms") or 0
-        duration = item.get("duration_ms") or 0
-        state = "Playing" if playback.get("is_playing") else "Paused"
-        return (
-            f"{state}: '{item['name']}' by {item['artists'][0]['name']} "
-            f"from '{item['album']['name']}' "
-            f"({progress // 60000}:{progress % 60000 // 1000:02d} / "
-            f"{duration // 60000}:{duration % 60000 // 1000:02d})"
-        )
-    except Exception as exc:
-        return _err("get the current track", exc)
+    sp = _spotify()
+    playback = _current_playback(sp)
+    if not playback or not playback.get("item"):
+        return "Nothing is playing on Spotify right now."
+    item = playback["item"]
+    progress = playback.get("progress_ms") or 0
+    duration = item.get("duration_ms") or 0
+    state = "Playing" if playback.get("is_playing") else "Paused"
+    return (
+        f"{state}: '{item['name']}' by {item['artists'][0]['name']} "
+        f"from '{item['album']['name']}' "
+        f"({progress // 60000}:{progress % 60000 // 1000:02d} / "
+        f"{duration // 60000}:{duration % 60000 // 1000:02d})"
+    )
 
 
 @tool
+@_spotify_tool("list devices")
 def list_devices() -> str:
     """List the user's available Spotify devices (name, type, active state)."""
-    try:
-        devices = (_spotify().devices() or {}).get("devices", [])
-        if not devices:
-            return (
-                "No Spotify devices found. Open the Spotify app on your computer or "
-                "phone, then try again."
-            )
-        return f"Spotify devices:\n{_describe_devices(devices)}"
-    except Exception as exc:
-        return _err("list devices", exc)
+    devices = _devices(_spotify(), fresh=True)
+    if not devices:
+        return (
+            "No Spotify devices found. Open the Spotify app on your computer or "
+            "phone, then try again."
+        )
+    return f"Spotify devices:\n{_describe_devices(devices)}"
 
 
 @tool
+@_spotify_tool("transfer playback")
 def play_on_device(device_name: str) -> str:
     """Transfer Spotify playback to a specific device by name.
 
@@ -320,27 +539,29 @@ def play_on_device(device_name: str) -> str:
         device_name: Device name as shown by list_devices (case-insensitive,
             partial match allowed).
     """
-    try:
-        if not device_name.strip():
-            return "A device name is required. Use list_devices to see options."
-        sp = _spotify()
-        devices = (sp.devices() or {}).get("devices", [])
-        if not devices:
-            return "No Spotify devices found. Open the Spotify app somewhere first."
-        wanted = device_name.strip().lower()
+    if not device_name.strip():
+        return "A device name is required. Use list_devices to see options."
+    sp = _spotify()
+    wanted = device_name.strip().lower()
+    for fresh in (False, True):  # a device opened moments ago may not be cached yet
+        devices = _devices(sp, fresh=fresh)
         match = next(
             (d for d in devices if d.get("name", "").lower() == wanted),
             None,
         ) or next((d for d in devices if wanted in d.get("name", "").lower()), None)
-        if not match:
-            return (
-                f"No device matching '{device_name}'. Available devices:\n"
-                f"{_describe_devices(devices)}"
-            )
-        sp.transfer_playback(match["id"], force_play=True)
-        return f"Playback transferred to '{match.get('name', device_name)}'."
-    except Exception as exc:
-        return _err("transfer playback", exc)
+        if match:
+            break
+    if not devices:
+        return "No Spotify devices found. Open the Spotify app somewhere first."
+    if not match:
+        return (
+            f"No device matching '{device_name}'. Available devices:\n{_describe_devices(devices)}"
+        )
+    sp.transfer_playback(match["id"], force_play=True)
+    _forget_playback()
+    _forget_device()  # the cached listing still marks the old device active
+    _remember_device(match["id"])
+    return f"Playback transferred to '{match.get('name', device_name)}'."
 
 
 TOOLS = [
@@ -8,6 +8,7 @@ minutes", "tomorrow 9am") using the current date/time from its prompt.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import datetime, timedelta
 
 from langchain_core.tools import tool
@@ -18,6 +19,10 @@ logger = logging.getLogger(__name__)
 
 _store: Store | None = None
 
+# Set by app.py: wakes the scheduler so it re-plans its sleep around a reminder
+# that was just added (tools run in worker threads, so it must be thread-safe).
+on_schedule_change: Callable[[], None] | None = None
+
 
 def _get_store() -> Store:
     global _store
@@ -26,10 +31,28 @@ def _get_store() -> Store:
     return _store
 
 
+def _scheduled() -> None:
+    if on_schedule_change is not None:
+        on_schedule_change()
+
+
 def _fmt(ts: float) -> str:
     return datetime.fromtimestamp(ts).strftime("%a %b %d, %I:%M %p")
 
 
+def _humanize(seconds: float) -> str:
+    """Spoken-friendly duration: "30 seconds", "1 hour 5 minutes"."""
+    total = round(seconds)
+    hours, rest = divmod(total, 3600)
+    minutes, secs = divmod(rest, 60)
+    parts = [
+        f"{n} {unit}{'' if n == 1 else 's'}"
+        for n, unit in ((hours, "hour"), (minutes, "minute"), (secs, "second"))
+        if n
+    ]
+    return " ".join(parts) or "0 seconds"
+
+
 @tool
 def set_reminder(text: str, due_iso: str) -> str:
     """Schedule a reminder that will be spoken and shown as a notification.
@@ -46,6 +69,7 @@ def set_reminder(text: str, due_iso: str) -> str:
     if due <= datetime.now():
         return f"That time ({_fmt(due.timestamp())}) is in the past."
     reminder_id = _get_store().add_reminder(text, due.timestamp())
+    _scheduled()
     return f"Reminder #{reminder_id} set for {_fmt(due.timestamp())}: {text}"
 
 
@@ -61,7 +85,8 @@ def set_timer(minutes: float, label: str = "Timer") -> str:
         return "Timer must be between a few seconds and 24 hours."
     due = datetime.now() + timedelta(minutes=minutes)
     reminder_id = _get_store().add_reminder(f"{label} — time's up!", due.timestamp())
-    return f"Timer #{reminder_id} ({label}) set for {minutes:g} minutes from now."
+    _scheduled()
+    return f"Timer #{reminder_id} ({label}) set for {_humanize(minutes * 60)} from now."
 
 
 @tool